@@ -37,6 +37,16 @@ class Simulator(models.Model):
         name="start_date", null=True, blank=True, default=timezone.now
     )
 
+    # The number of processes simulating the datasets in parallel,
+    # if it's not set then the TIMESERIES_MAX_WORKERS setting is used
+    max_workers = models.PositiveIntegerField(
+        name="max_workers", null=True, blank=True, default=None
+    )
+
+    # The root seed of the random streams, so that the runs are reproducible
+    seed = models.PositiveBigIntegerField(
+        name="seed", null=True, blank=True, default=None
+    )
 
 class Dataset(models.Model):
     # This is the frequency of the time index used in pandas
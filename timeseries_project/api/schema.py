@@ -45,6 +45,8 @@ class SimulatorType(DjangoObjectType):
             "sink_name",
             "interval",
             "status",
+            "max_workers",
+            "seed",
         ]
 
 
@@ -54,6 +56,8 @@ class SimulatorInput(graphene.InputObjectType):
     end_date = graphene.String()
     type = graphene.String()
     sink_name = graphene.String()
+    max_workers = graphene.Int()
+    seed = graphene.Int()
     datasets = graphene.List(lambda: DatasetInput)
 
 
@@ -43,6 +43,8 @@ class SimulatorSerializer(serializers.ModelSerializer):
             "datasets",
             "sink_name",
             "interval",
+            "max_workers",
+            "seed",
         ]
 
     def validate(self, attrs):
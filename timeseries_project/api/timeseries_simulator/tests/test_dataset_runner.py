@@ -0,0 +1,78 @@
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from api.timeseries_simulator.timeseries.timeseries_scheduler.dataset_runner import (
+    DatasetRunner,
+)
+from api.timeseries_simulator.timeseries.timeseries_simulator import TimeSeriesParams
+from api.timeseries_simulator.timeseries.timeseries_components.generators.seasonality import (
+    SeasonalityGenerator,
+)
+from api.timeseries_simulator.timeseries.timeseries_components.generators.trend import (
+    TrendGenerator,
+)
+from api.timeseries_simulator.timeseries.timeseries_components.transformers.noise import (
+    NoiseTransformer,
+)
+from api.timeseries_simulator.timeseries.timeseries_components.transformers.outlier import (
+    OutlierTransformer,
+)
+
+
+class TestDatasetRunner(TestCase):
+    def setUp(self) -> None:
+        time_index = pd.date_range(start="2021-01-01", periods=200, freq="1H")
+        self.params_list = [
+            TimeSeriesParams(
+                time_index=time_index,
+                main_components=[
+                    TrendGenerator([0.01 * i, 1.0]),
+                    SeasonalityGenerator(period=1, amplitude=2),
+                ],
+                residual_components=[NoiseTransformer(0.5), OutlierTransformer(0.05)],
+                multiplicative=False,
+            )
+            for i in range(6)
+        ]
+
+    def _run(self, max_workers, seed=7):
+        results = {}
+        for position, result, error in DatasetRunner(max_workers, seed).run(
+            self.params_list
+        ):
+            self.assertIsNone(error)
+            results[position] = result
+        return [results[position] for position in range(len(self.params_list))]
+
+    def test_parallel_runs_are_deterministic(self):
+        """Tests that a seeded parallel run doesn't depend on the number of workers."""
+        first_run = self._run(max_workers=2)
+        second_run = self._run(max_workers=3)
+
+        for first, second in zip(first_run, second_run):
+            np.testing.assert_array_equal(first.values, second.values)
+
+    def test_datasets_have_independent_streams(self):
+        """Tests that every dataset gets its own random stream."""
+        results = self._run(max_workers=2)
+
+        noise = [r.values - r.values.mean() for r in results]
+        self.assertFalse(np.allclose(noise[0], noise[1]))
+
+    def test_failed_dataset_does_not_stop_the_others(self):
+        """Tests that a failing dataset is reported without losing the others."""
+        self.params_list[2].main_components = []
+
+        for max_workers in (1, 2):
+            errors = {
+                position: error
+                for position, _, error in DatasetRunner(max_workers).run(
+                    self.params_list
+                )
+            }
+
+            self.assertEqual(len(errors), len(self.params_list))
+            self.assertIsNotNone(errors[2])
+            self.assertTrue(all(errors[p] is None for p in errors if p != 2))
@@ -0,0 +1,185 @@
+from functools import reduce
+from operator import add, mul
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from ..timeseries.timeseries_simulator import TimeSeriesParams, TimeSeriesSimulator
+from ..timeseries.timeseries_components.generators.generator import Generator
+from ..timeseries.timeseries_components.generators.seasonality import (
+    SeasonalityGenerator,
+)
+from ..timeseries.timeseries_components.generators.static_signal import (
+    StaticSignalGenerator,
+)
+from ..timeseries.timeseries_components.generators.trend import TrendGenerator
+from ..timeseries.timeseries_components.transformers.missing_value import (
+    MissingValueTransformer,
+)
+from ..timeseries.timeseries_components.transformers.noise import NoiseTransformer
+from ..timeseries.timeseries_components.transformers.normalization import (
+    NormalizationTransformer,
+)
+from ..timeseries.timeseries_components.transformers.outlier import (
+    OutlierTransformer,
+)
+
+
+class TestTimeSeriesSimulator(TestCase):
+    def setUp(self) -> None:
+        self.time_index = pd.date_range(start="2021-01-01", periods=500, freq="1H")
+
+    def _params(self, coefficients, multiplicative=True, residual_components=None):
+        return TimeSeriesParams(
+            time_index=self.time_index,
+            main_components=[
+                TrendGenerator(coefficients),
+                SeasonalityGenerator(period=1, amplitude=3, phase_shift=0.5),
+                SeasonalityGenerator(period=7, amplitude=2, multiplier=2),
+            ],
+            residual_components=residual_components or [],
+            multiplicative=multiplicative,
+        )
+
+    def test_simulate_batch_matches_simulate(self):
+        """Tests that the batch mode gives the same series as the one by one mode."""
+        params_list = [
+            self._params([0.001, 2.5, 1.0, 3.0]),
+            self._params([1.0, 2.0], multiplicative=False),
+            self._params([], multiplicative=False),
+            self._params([0.5]),
+        ]
+
+        results = TimeSeriesSimulator.simulate_batch(params_list)
+
+        self.assertEqual(len(results), len(params_list))
+        for params, result in zip(params_list, results):
+            expected = TimeSeriesSimulator(params).simulate()
+            self.assertTrue(result.index.equals(self.time_index))
+            np.testing.assert_allclose(result.values, expected.values)
+
+    def test_simulate_batch_different_indexes(self):
+        """Tests that datasets with different time indexes are simulated separately."""
+        params = self._params([1.0, 0.0])
+        other_params = TimeSeriesParams(
+            time_index=pd.date_range(start="2021-01-01", periods=10, freq="1D"),
+            main_components=[StaticSignalGenerator(2.0)],
+            residual_components=[],
+        )
+
+        results = TimeSeriesSimulator.simulate_batch([params, other_params])
+
+        self.assertEqual(len(results[0]), 500)
+        self.assertEqual(len(results[1]), 10)
+        np.testing.assert_allclose(results[1].values, np.full(10, 2.0))
+
+    def test_simulate_batch_residual_components(self):
+        """Tests that the residual components are applied to every row of the batch."""
+        params_list = [
+            self._params(
+                [1.0],
+                residual_components=[
+                    NoiseTransformer(0.1),
+                    OutlierTransformer(0.1),
+                    MissingValueTransformer(0.2),
+                ],
+            )
+            for _ in range(3)
+        ]
+
+        results = TimeSeriesSimulator.simulate_batch(params_list)
+
+        for params, result in zip(params_list, results):
+            missing_indices = params.residual_components[2].missing_indices
+            self.assertEqual(len(missing_indices), 100)
+            self.assertEqual(result.isna().sum(), 100)
+            self.assertTrue(result.iloc[missing_indices].isna().all())
+
+    def test_simulate_iter_matches_simulate(self):
+        """Tests that the joined windows of simulate_iter match a one-shot run."""
+        params = self._params([0.001, 2.5, 1.0, 3.0])
+        params.main_components.append(StaticSignalGenerator(2.0))
+        simulator = TimeSeriesSimulator(params)
+
+        chunks = list(simulator.simulate_iter(chunk_size=120))
+
+        self.assertEqual([len(chunk) for chunk in chunks], [120, 120, 120, 120, 20])
+        joined = pd.concat(chunks)
+        expected = simulator.simulate()
+        self.assertTrue(joined.index.equals(expected.index))
+        np.testing.assert_allclose(joined.values, expected.values)
+
+    def test_simulate_iter_residual_ratio(self):
+        """Tests that the residual components are applied to every window."""
+        params = self._params([1.0], residual_components=[MissingValueTransformer(0.1)])
+
+        chunks = list(TimeSeriesSimulator(params).simulate_iter(chunk_size=100))
+
+        self.assertTrue(all(chunk.isna().sum() == 10 for chunk in chunks))
+
+    def test_simulate_iter_invalid_chunk_size(self):
+        simulator = TimeSeriesSimulator(self._params([1.0]))
+        with self.assertRaises(ValueError):
+            next(simulator.simulate_iter(chunk_size=0))
+
+    def test_simulate_matches_series_components(self):
+        """Tests that the in-place buffer path matches the pd.Series component path."""
+        residual_components = [
+            NoiseTransformer(0.1),
+            OutlierTransformer(0.05),
+            MissingValueTransformer(0.1),
+            NormalizationTransformer((0, 1)),
+        ]
+        for multiplicative in (True, False):
+            params = self._params(
+                [0.001, 2.5, 1.0],
+                multiplicative=multiplicative,
+                residual_components=residual_components,
+            )
+            params.main_components.append(StaticSignalGenerator(2.0))
+
+            np.random.seed(0)
+            operation = mul if multiplicative else add
+            expected = reduce(
+                operation,
+                [mc.generate(self.time_index) for mc in params.main_components],
+            )
+            for rc in residual_components:
+                expected = rc.transform(expected)
+
+            np.random.seed(0)
+            result = TimeSeriesSimulator(params).simulate()
+
+            np.testing.assert_allclose(result.values, expected.values)
+
+    def test_simulate_into_default_protocol(self):
+        """Tests that components implementing only 'generate' still work in place."""
+
+        class RampGenerator(Generator):
+            def generate(self, time_index, offset=0):
+                return pd.Series(np.arange(offset, offset + len(time_index)) * 2.0)
+
+        params = TimeSeriesParams(
+            time_index=self.time_index,
+            main_components=[StaticSignalGenerator(1.0), RampGenerator()],
+            residual_components=[],
+            multiplicative=False,
+        )
+        out = np.empty(len(self.time_index))
+
+        result = TimeSeriesSimulator(params).simulate_into(out)
+
+        self.assertIs(result, out)
+        np.testing.assert_allclose(out, np.arange(500) * 2.0 + 1.0)
+
+    def test_normalization_transform_batch(self):
+        """Tests that the batch normalization matches the MinMaxScaler one."""
+        matrix = np.random.normal(size=(3, 50))
+        transformers = [NormalizationTransformer((0, 1)) for _ in range(3)]
+
+        result = NormalizationTransformer.transform_batch(transformers, matrix)
+
+        for row, transformer in zip(range(3), transformers):
+            expected = transformer.transform(pd.Series(matrix[row]))
+            np.testing.assert_allclose(result[row], expected.values)
@@ -1,10 +1,12 @@
 from abc import ABC, abstractmethod
+from typing import List
 import pandas as pd
+import numpy as np
 
 
 class Generator(ABC):
     @abstractmethod
-    def generate(self, time_index: pd.DatetimeIndex) -> pd.Series:
+    def generate(self, time_index: pd.DatetimeIndex, offset: int = 0) -> pd.Series:
         """
         Abstract method for generating a time series component.
 
@@ -14,7 +16,78 @@ class Generator(ABC):
         Args:
             time_index (pd.DatetimeIndex): A DatetimeIndex representing the time points
                 for which the time series component should be generated.
+            offset (int): The position of the first point of 'time_index' in the whole
+                series, so that a series generated chunk by chunk matches a one-shot run.
 
         Returns:
             pd.Series: A pandas Series representing the generated time series component.
         """
+
+    @classmethod
+    def generate_batch(
+        cls,
+        generators: List["Generator"],
+        time_index: pd.DatetimeIndex,
+        offset: int = 0,
+    ) -> np.ndarray:
+        """
+        Generates the components of several generators of this class in one call.
+
+        The default implementation calls 'generate' once per generator, subclasses
+        can override it to evaluate all the generators in a single vectorized pass.
+
+        Args:
+            generators (List[Generator]): The generators to evaluate, all instances of 'cls'.
+            time_index (pd.DatetimeIndex): The time index shared by all the generators.
+            offset (int): The position of the first point of 'time_index' in the whole series.
+
+        Returns:
+            np.ndarray: A (len(generators), len(time_index)) float array, where each row
+                is the component generated by the generator at the same position.
+        """
+        return np.vstack(
+            [
+                np.asarray(g.generate(time_index, offset), dtype=float)
+                for g in generators
+            ]
+        )
+
+    def generate_into(
+        self, out: np.ndarray, time_index: pd.DatetimeIndex, offset: int = 0
+    ) -> np.ndarray:
+        """
+        Generates the component directly into a preallocated float buffer.
+
+        The default implementation copies the result of 'generate', subclasses can
+        override it to write into 'out' without allocating intermediate arrays.
+
+        Args:
+            out (np.ndarray): A float64 buffer of len(time_index) points to write into.
+            time_index (pd.DatetimeIndex): The time points of the component.
+            offset (int): The position of the first point of 'time_index' in the whole series.
+
+        Returns:
+            np.ndarray: The 'out' buffer.
+        """
+        out[:] = np.asarray(self.generate(time_index, offset), dtype=float)
+        return out
+
+
+def fill_positions(out: np.ndarray, offset: int = 0) -> np.ndarray:
+    """
+    Fills a float buffer in place with the positions offset, offset + 1, ...
+
+    It is the in-place equivalent of np.arange(offset, offset + len(out)), it
+    is exact as long as the positions are below 2**53.
+
+    Args:
+        out (np.ndarray): The float buffer to fill.
+        offset (int): The first position.
+
+    Returns:
+        np.ndarray: The 'out' buffer.
+    """
+    out.fill(1.0)
+    np.cumsum(out, out=out)
+    out += offset - 1
+    return out
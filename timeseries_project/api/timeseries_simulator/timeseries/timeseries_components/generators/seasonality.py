@@ -1,7 +1,8 @@
 
-from .generator import Generator
+from .generator import Generator, fill_positions
 import pandas as pd
 import numpy as np
+from typing import List
 
 
 class SeasonalityGenerator(Generator):
@@ -29,13 +30,14 @@ class SeasonalityGenerator(Generator):
         self.multiplier = multiplier
 
 
-    def generate(self, time_index: pd.DatetimeIndex) -> pd.Series:
+    def generate(self, time_index: pd.DatetimeIndex, offset: int = 0) -> pd.Series:
         """
         Generates a sinusoidal seasonality component for a time series.
 
         Args:
             time_index (pd.DatetimeIndex): A DatetimeIndex representing the time points
                 for which the seasonality component should be generated.
+            offset (int): The position of the first point of 'time_index' in the whole series.
 
         Returns:
             pd.Series: A pandas Series representing the generated sinusoidal seasonality component.
@@ -53,7 +55,7 @@ class SeasonalityGenerator(Generator):
         - phase_shift: The phase shift (in radians) applied to the sinusoidal wave.
         """
         # sequence of numbers from 0 to the number of timestamps
-        time = np.arange(len(time_index))
+        time = np.arange(offset, offset + len(time_index))
 
         return pd.Series(
             self.multiplier
@@ -63,6 +65,64 @@ class SeasonalityGenerator(Generator):
             )
         )
 
+    def generate_into(
+        self, out: np.ndarray, time_index: pd.DatetimeIndex, offset: int = 0
+    ) -> np.ndarray:
+        """
+        Generate the seasonality component in place, without intermediate arrays.
+
+        Args:
+            out (np.ndarray): A float64 buffer of len(time_index) points to write into.
+            time_index (pd.DatetimeIndex): The time points of the seasonality component.
+            offset (int): The position of the first point of 'time_index' in the whole series.
+
+        Returns:
+            np.ndarray: The 'out' buffer holding the seasonality component.
+        """
+        fill_positions(out, offset)
+        out *= 2 * np.pi
+        out /= self.__total_period
+        out += self.phase_shift
+        np.sin(out, out=out)
+        out *= self.amplitude
+        out *= self.multiplier
+        return out
+
+    @classmethod
+    def generate_batch(
+        cls,
+        generators: List["SeasonalityGenerator"],
+        time_index: pd.DatetimeIndex,
+        offset: int = 0,
+    ) -> np.ndarray:
+        """
+        Generate the seasonality components of several generators in one vectorized pass.
+
+        Args:
+            generators (List[SeasonalityGenerator]): The seasonality generators to evaluate.
+            time_index (pd.DatetimeIndex): The time index shared by all the generators.
+            offset (int): The position of the first point of 'time_index' in the whole series.
+
+        Returns:
+            np.ndarray: A (len(generators), len(time_index)) array where each row is
+                multiplier * amplitude * sin(2 * pi * time / total_period + phase_shift).
+        """
+        total_periods = np.array([[g.__total_period] for g in generators])
+        phase_shifts = np.array([[g.phase_shift] for g in generators], dtype=float)
+        amplitudes = np.array([[g.amplitude] for g in generators], dtype=float)
+        multipliers = np.array([[g.multiplier] for g in generators], dtype=float)
+
+        # sequence of numbers from 0 to the number of timestamps
+        time = 2 * np.pi * np.arange(offset, offset + len(time_index))
+
+        result = time / total_periods
+        result += phase_shifts
+        np.sin(result, out=result)
+        result *= amplitudes
+        result *= multipliers
+
+        return result
+
     @property
     def __total_period(self) -> int:
         """Convert the total period to minutes depending on the period type"""
@@ -2,6 +2,7 @@
 from .generator import Generator
 import pandas as pd
 import numpy as np
+from typing import List
 
 
 class StaticSignalGenerator(Generator):
@@ -11,13 +12,14 @@ class StaticSignalGenerator(Generator):
         self.magnitude = magnitude
 
 
-    def generate(self, time_index: pd.DatetimeIndex) -> pd.Series:
+    def generate(self, time_index: pd.DatetimeIndex, offset: int = 0) -> pd.Series:
         """
         Generate a static signal component for a time series.
 
         Args:
             time_index (pd.DatetimeIndex): A DatetimeIndex representing the time points
                 for which the static signal component should be generated.
+            offset (int): The position of the first point of 'time_index' in the whole series.
 
         Returns:
             pd.Series: A pandas Series representing the generated static signal component.
@@ -30,9 +32,47 @@ class StaticSignalGenerator(Generator):
         - time_index: A DatetimeIndex specifying the time points for the generated signal.
 
         Returns:
-        - pd.Series: A pandas Series with constant values equal to 'self.magnitude' and
-        indexed by the provided 'time_index'.
+        - pd.Series: A pandas Series with constant values equal to 'self.magnitude', one
+        per time point of the provided 'time_index'. Like the other generators, it is
+        positionally indexed so that it aligns with them when the components are combined.
         """
-        return pd.Series(
-            np.ones(time_index.shape[0]) * self.magnitude, index=time_index
-        )
+        return pd.Series(np.ones(time_index.shape[0]) * self.magnitude)
+
+    def generate_into(
+        self, out: np.ndarray, time_index: pd.DatetimeIndex, offset: int = 0
+    ) -> np.ndarray:
+        """
+        Fill a preallocated buffer with the static signal component.
+
+        Args:
+            out (np.ndarray): A float64 buffer of len(time_index) points to write into.
+            time_index (pd.DatetimeIndex): The time points of the static signal component.
+            offset (int): The position of the first point of 'time_index' in the whole series.
+
+        Returns:
+            np.ndarray: The 'out' buffer filled with 'self.magnitude'.
+        """
+        out.fill(self.magnitude)
+        return out
+
+    @classmethod
+    def generate_batch(
+        cls,
+        generators: List["StaticSignalGenerator"],
+        time_index: pd.DatetimeIndex,
+        offset: int = 0,
+    ) -> np.ndarray:
+        """
+        Generate the static signal components of several generators in one call.
+
+        Args:
+            generators (List[StaticSignalGenerator]): The static signal generators to evaluate.
+            time_index (pd.DatetimeIndex): The time index shared by all the generators.
+            offset (int): The position of the first point of 'time_index' in the whole series.
+
+        Returns:
+            np.ndarray: A (len(generators), len(time_index)) array, each row filled with
+                the magnitude of its generator.
+        """
+        magnitudes = np.array([[g.magnitude] for g in generators], dtype=float)
+        return np.repeat(magnitudes, len(time_index), axis=1)
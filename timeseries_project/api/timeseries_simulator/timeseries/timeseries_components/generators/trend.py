@@ -1,4 +1,4 @@
-from .generator import Generator
+from .generator import Generator, fill_positions
 import pandas as pd
 import numpy as np
 from typing import List
@@ -17,13 +17,14 @@ class TrendGenerator(Generator):
         self.coefficients = coefficients
 
 
-    def generate(self, time_index: pd.DatetimeIndex) -> pd.Series:
+    def generate(self, time_index: pd.DatetimeIndex, offset: int = 0) -> pd.Series:
         """
         Generate the trend component for a time series.
 
         Args:
             time_index (pd.DatetimeIndex): A DatetimeIndex representing the time points
                 for which the trend component should be generated.
+            offset (int): The position of the first point of 'time_index' in the whole series.
 
         Returns:
             pd.Series: A pandas Series representing the generated trend component.
@@ -41,5 +42,71 @@ class TrendGenerator(Generator):
         """
 
         # sequence of numbers from 0 to the number of timestamps
-        time = np.arange(len(time_index))
+        time = np.arange(offset, offset + len(time_index))
         return pd.Series(np.polyval(self.coefficients, time))
+
+    def generate_into(
+        self, out: np.ndarray, time_index: pd.DatetimeIndex, offset: int = 0
+    ) -> np.ndarray:
+        """
+        Generate the trend component into a preallocated buffer with Horner's method.
+
+        Args:
+            out (np.ndarray): A float64 buffer of len(time_index) points to write into.
+            time_index (pd.DatetimeIndex): The time points of the trend component.
+            offset (int): The position of the first point of 'time_index' in the whole series.
+
+        Returns:
+            np.ndarray: The 'out' buffer holding the trend component.
+        """
+        if len(self.coefficients) == 0:
+            out.fill(0.0)
+            return out
+
+        out.fill(self.coefficients[0])
+        if len(self.coefficients) == 1:
+            return out
+
+        time = fill_positions(np.empty_like(out), offset)
+        for coefficient in self.coefficients[1:]:
+            out *= time
+            out += coefficient
+
+        return out
+
+    @classmethod
+    def generate_batch(
+        cls,
+        generators: List["TrendGenerator"],
+        time_index: pd.DatetimeIndex,
+        offset: int = 0,
+    ) -> np.ndarray:
+        """
+        Generate the trend components of several generators in one vectorized pass.
+
+        The coefficients are left-padded with zeros to the highest degree, then all the
+        polynomials are evaluated together with Horner's method, row by row.
+
+        Args:
+            generators (List[TrendGenerator]): The trend generators to evaluate.
+            time_index (pd.DatetimeIndex): The time index shared by all the generators.
+            offset (int): The position of the first point of 'time_index' in the whole series.
+
+        Returns:
+            np.ndarray: A (len(generators), len(time_index)) array of trend components.
+        """
+        degree = max(len(g.coefficients) for g in generators)
+        coefficients = np.zeros((len(generators), max(degree, 1)))
+        for row, generator in enumerate(generators):
+            if len(generator.coefficients):
+                coefficients[row, degree - len(generator.coefficients) :] = (
+                    generator.coefficients
+                )
+
+        time = np.arange(offset, offset + len(time_index))
+        result = np.repeat(coefficients[:, :1], len(time), axis=1)
+        for k in range(1, degree):
+            result *= time
+            result += coefficients[:, k : k + 1]
+
+        return result
@@ -1,6 +1,7 @@
 
 from .transformer import Transformer
 import numpy as np
+from typing import List
 import pandas as pd
 
 
@@ -44,3 +45,51 @@ class MissingValueTransformer(Transformer):
         data_with_missing[self.missing_indices] = np.nan
 
         return data_with_missing
+
+    def transform_inplace(self, buffer: np.ndarray) -> np.ndarray:
+        """
+        Add missing values to the time series values in place.
+
+        Args:
+            buffer (np.ndarray): The float64 time series values to add missing values to.
+
+        Returns:
+            np.ndarray: The 'buffer' with NaN at 'missing_values_ratio' of its points.
+        """
+        num_missing = int(buffer.shape[0] * self.missing_values_ratio)
+        self.missing_indices = np.random.choice(
+            buffer.shape[0], size=num_missing, replace=False
+        )
+        buffer[self.missing_indices] = np.nan
+        return buffer
+
+    @classmethod
+    def transform_batch(
+        cls, transformers: List["MissingValueTransformer"], time_series_matrix: np.ndarray
+    ) -> np.ndarray:
+        """
+        Add missing values to every row of a matrix of time series.
+
+        The chosen positions are flattened into a single fancy index, so all the
+        rows are updated with one assignment.
+
+        Args:
+            transformers (List[MissingValueTransformer]): The transformers, one per row.
+            time_series_matrix (np.ndarray): A (len(transformers), n_points) float array.
+
+        Returns:
+            np.ndarray: A new array where each row has its own ratio of NaN values.
+        """
+        num_points = time_series_matrix.shape[1]
+        flat_indices = []
+        for row, transformer in enumerate(transformers):
+            num_missing = int(num_points * transformer.missing_values_ratio)
+            transformer.missing_indices = np.random.choice(
+                num_points, size=num_missing, replace=False
+            )
+            flat_indices.append(transformer.missing_indices + row * num_points)
+
+        data_with_missing = time_series_matrix.copy()
+        data_with_missing.ravel()[np.concatenate(flat_indices)] = np.nan
+
+        return data_with_missing
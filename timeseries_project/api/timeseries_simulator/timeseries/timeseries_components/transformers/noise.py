@@ -2,6 +2,7 @@
 from .transformer import Transformer
 import pandas as pd
 import numpy as np
+from typing import List
 
 
 class NoiseTransformer(Transformer):
@@ -34,3 +35,35 @@ class NoiseTransformer(Transformer):
 
         noise = np.random.normal(0, self.noise_level, size=len(time_series))
         return pd.Series(time_series.copy() + noise)
+
+    def transform_inplace(self, buffer: np.ndarray) -> np.ndarray:
+        """
+        Add random noise to the time series values in place.
+
+        Args:
+            buffer (np.ndarray): The float64 time series values to add noise to.
+
+        Returns:
+            np.ndarray: The 'buffer' with added random noise.
+        """
+        buffer += np.random.normal(0, self.noise_level, size=len(buffer))
+        return buffer
+
+    @classmethod
+    def transform_batch(
+        cls, transformers: List["NoiseTransformer"], time_series_matrix: np.ndarray
+    ) -> np.ndarray:
+        """
+        Add random noise to every row of a matrix of time series in one vectorized pass.
+
+        Args:
+            transformers (List[NoiseTransformer]): The noise transformers, one per row.
+            time_series_matrix (np.ndarray): A (len(transformers), n_points) float array.
+
+        Returns:
+            np.ndarray: A new array where each row has noise with its own noise_level added.
+        """
+        noise_levels = np.array([[t.noise_level] for t in transformers], dtype=float)
+        noise = np.random.normal(0, noise_levels, size=time_series_matrix.shape)
+        noise += time_series_matrix
+        return noise
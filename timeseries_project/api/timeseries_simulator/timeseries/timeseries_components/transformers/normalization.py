@@ -2,7 +2,7 @@ from .transformer import Transformer
 import pandas as pd
 import numpy as np
 from sklearn.preprocessing import MinMaxScaler
-from typing import Tuple
+from typing import List, Tuple
 
 
 class NormalizationTransformer(Transformer):
@@ -36,4 +36,60 @@ class NormalizationTransformer(Transformer):
         scaler = MinMaxScaler(feature_range=self.feature_range)
         values = time_series.values
         values = np.array(values).reshape(-1, 1)
-        return pd.Series(scaler.fit_transform(values))
+        return pd.Series(scaler.fit_transform(values).ravel())
+
+    def transform_inplace(self, buffer: np.ndarray) -> np.ndarray:
+        """
+        Normalize the time series values in place to the feature range.
+
+        It computes the same scaling as MinMaxScaler, ignoring NaN values.
+
+        Args:
+            buffer (np.ndarray): The float64 time series values to normalize.
+
+        Returns:
+            np.ndarray: The normalized 'buffer'.
+        """
+        if len(buffer) == 0 or np.isnan(buffer).all():
+            return buffer
+
+        lower, upper = self.feature_range
+        data_min = np.nanmin(buffer)
+        data_range = np.nanmax(buffer) - data_min
+        # Constant series are mapped to the lower bound, as MinMaxScaler does
+        scale = (upper - lower) / (data_range if data_range != 0.0 else 1.0)
+
+        buffer *= scale
+        buffer += lower - data_min * scale
+        return buffer
+
+    @classmethod
+    def transform_batch(
+        cls, transformers: List["NormalizationTransformer"], time_series_matrix: np.ndarray
+    ) -> np.ndarray:
+        """
+        Normalize every row of a matrix of time series to its transformer's feature range.
+
+        This is the row-wise equivalent of fitting a MinMaxScaler on each row, NaN values
+        are ignored when computing the minimum and maximum.
+
+        Args:
+            transformers (List[NormalizationTransformer]): The transformers, one per row.
+            time_series_matrix (np.ndarray): A (len(transformers), n_points) float array.
+
+        Returns:
+            np.ndarray: A new array where each row is scaled to its feature range.
+        """
+        lower = np.array([[t.feature_range[0]] for t in transformers], dtype=float)
+        upper = np.array([[t.feature_range[1]] for t in transformers], dtype=float)
+
+        data_min = np.nanmin(time_series_matrix, axis=1, keepdims=True)
+        data_range = np.nanmax(time_series_matrix, axis=1, keepdims=True) - data_min
+        # Constant rows are mapped to the lower bound, as MinMaxScaler does
+        data_range[data_range == 0.0] = 1.0
+
+        scale = (upper - lower) / data_range
+        normalized = time_series_matrix * scale
+        normalized += lower - data_min * scale
+
+        return normalized
@@ -2,6 +2,7 @@
 from .transformer import Transformer
 import pandas as pd
 import numpy as np
+from typing import List
 
 
 class OutlierTransformer(Transformer):
@@ -53,3 +54,49 @@ class OutlierTransformer(Transformer):
         data_with_outliers[outlier_indices] = outliers
 
         return data_with_outliers
+
+    def transform_inplace(self, buffer: np.ndarray) -> np.ndarray:
+        """
+        Add random outliers to the time series values in place.
+
+        Args:
+            buffer (np.ndarray): The float64 time series values to add outliers to.
+
+        Returns:
+            np.ndarray: The 'buffer' with random outliers at 'outlier_ratio' of its points.
+        """
+        num_outliers = int(buffer.shape[0] * self.outlier_ratio)
+        if num_outliers == 0:
+            return buffer
+
+        outlier_indices = np.random.choice(buffer.shape[0], num_outliers, replace=False)
+        buffer[outlier_indices] = np.random.uniform(-1, 1, num_outliers)
+        return buffer
+
+    @classmethod
+    def transform_batch(
+        cls, transformers: List["OutlierTransformer"], time_series_matrix: np.ndarray
+    ) -> np.ndarray:
+        """
+        Add random outliers to every row of a matrix of time series.
+
+        Args:
+            transformers (List[OutlierTransformer]): The outlier transformers, one per row.
+            time_series_matrix (np.ndarray): A (len(transformers), n_points) float array.
+
+        Returns:
+            np.ndarray: A new array where each row has its own ratio of outliers.
+        """
+        data_with_outliers = time_series_matrix.copy()
+        num_points = time_series_matrix.shape[1]
+        for row, transformer in enumerate(transformers):
+            num_outliers = int(num_points * transformer.outlier_ratio)
+            if num_outliers == 0:
+                continue
+
+            outlier_indices = np.random.choice(num_points, num_outliers, replace=False)
+            data_with_outliers[row, outlier_indices] = np.random.uniform(
+                -1, 1, num_outliers
+            )
+
+        return data_with_outliers
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
+from typing import List
 import pandas as pd
+import numpy as np
 
 
 class Transformer(ABC):
@@ -20,3 +22,44 @@ class Transformer(ABC):
 
         Subclasses should implement this method to define their own data transformation logic.
         """
+
+    @classmethod
+    def transform_batch(
+        cls, transformers: List["Transformer"], time_series_matrix: np.ndarray
+    ) -> np.ndarray:
+        """
+        Applies several transformers of this class to the rows of a matrix in one call.
+
+        The default implementation calls 'transform' once per row, subclasses can
+        override it to transform all the rows in a single vectorized pass.
+
+        Args:
+            transformers (List[Transformer]): The transformers to apply, all instances of 'cls'.
+            time_series_matrix (np.ndarray): A (len(transformers), n_points) float array,
+                the i-th row is transformed by the i-th transformer.
+
+        Returns:
+            np.ndarray: A new array with the same shape holding the transformed rows.
+        """
+        return np.vstack(
+            [
+                np.asarray(t.transform(pd.Series(row)), dtype=float)
+                for t, row in zip(transformers, time_series_matrix)
+            ]
+        )
+
+    def transform_inplace(self, buffer: np.ndarray) -> np.ndarray:
+        """
+        Applies the transformation directly to a float buffer.
+
+        The default implementation copies the result of 'transform' back into the
+        buffer, subclasses can override it to modify the buffer without copies.
+
+        Args:
+            buffer (np.ndarray): The float64 time series values to transform in place.
+
+        Returns:
+            np.ndarray: The transformed 'buffer'.
+        """
+        buffer[:] = np.asarray(self.transform(pd.Series(buffer)), dtype=float)
+        return buffer
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Iterable
 import pandas as pd
 
 
@@ -18,3 +19,19 @@ class ProducerInterface(ABC):
         Subclasses should implement this method to define their own logic for producing
         or writing time series data to a particular format or destination.
         """
+
+    def produce_stream(self, time_series_chunks: Iterable[pd.Series]):
+        """
+        Produces a time series that is generated as a sequence of contiguous windows.
+
+        The default implementation joins the windows and calls 'produce' once, so every
+        producer accepts a stream. Producers that can write a window as soon as it
+        arrives should override it to keep the memory bounded by the window size.
+
+        Args:
+            time_series_chunks (Iterable[pd.Series]): The windows of the time series,
+                in order (see TimeSeriesSimulator.simulate_iter).
+        """
+        chunks = list(time_series_chunks)
+        if chunks:
+            self.produce(pd.concat(chunks))
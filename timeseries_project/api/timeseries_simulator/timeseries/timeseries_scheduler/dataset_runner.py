@@ -0,0 +1,184 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Dict, Iterator, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from api.timeseries_simulator.timeseries.timeseries_simulator import (
+    TimeSeriesParams,
+    TimeSeriesSimulator,
+)
+from api.timeseries_simulator.timeseries.timeseries_scheduler.shared_buffer import (
+    SharedResultBuffer,
+)
+
+# The result of one dataset: its position in the params list, the simulated
+# time series and the exception raised while simulating it (if any)
+DatasetResult = Tuple[int, Optional[pd.Series], Optional[Exception]]
+
+
+def simulate_dataset(
+    time_series_params: TimeSeriesParams,
+    seed_sequence: np.random.SeedSequence,
+    buffer_name: str,
+):
+    """
+    Simulates one dataset with its own random stream into a shared memory buffer.
+
+    The components draw from the global NumPy random state, so it is reseeded from
+    the dataset's seed sequence before simulating. This makes the result of a dataset
+    independent of the worker that runs it and of the other datasets.
+
+    Args:
+        time_series_params (TimeSeriesParams): The parameters of the dataset.
+        seed_sequence (np.random.SeedSequence): The seed sequence of the dataset.
+        buffer_name (str): The name of the SharedResultBuffer to write the values to,
+            it is created and released by the parent process.
+    """
+    np.random.seed(seed_sequence.generate_state(4))
+
+    length = len(time_series_params.time_index)
+    buffer = SharedResultBuffer.attach(buffer_name, length)
+    try:
+        TimeSeriesSimulator(time_series_params).simulate_into(buffer.array)
+    finally:
+        buffer.close()
+
+
+class DatasetRunner:
+    def __init__(self, max_workers: int = 1, seed: Optional[int] = None):
+        """
+        Initializes a DatasetRunner instance.
+
+        Args:
+            max_workers (int): The number of worker processes, 1 simulates the datasets
+                in the current process.
+            seed (Optional[int]): The root seed of the run, None draws fresh entropy.
+        """
+        self.max_workers = max(1, max_workers)
+        self.seed = seed
+        self._buffers: Dict[int, SharedResultBuffer] = {}
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "DatasetRunner":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Stops the workers and releases the shared memory of the unfinished datasets.
+
+        It is called when the run ends, fails or is stopped, the time series yielded
+        before stay valid until they are garbage collected.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+        for buffer in self._buffers.values():
+            buffer.release()
+        self._buffers.clear()
+
+    def run(self, params_list: List[TimeSeriesParams]) -> Iterator[DatasetResult]:
+        """
+        Simulates the datasets, yielding every result as soon as it is ready.
+
+        A dataset that fails does not stop the others, its exception is yielded
+        instead of its time series.
+
+        Args:
+            params_list (List[TimeSeriesParams]): The parameters of the datasets.
+
+        Yields:
+            DatasetResult: (position, time series, None) for a simulated dataset and
+                (position, None, exception) for a failed one.
+        """
+        if self.max_workers == 1:
+            yield from self._run_sequential(params_list)
+        else:
+            yield from self._run_parallel(params_list)
+
+    def _run_sequential(
+        self, params_list: List[TimeSeriesParams]
+    ) -> Iterator[DatasetResult]:
+        """Simulates the datasets in the current process with the batch mode."""
+        if self.seed is not None:
+            np.random.seed(self.seed)
+
+        try:
+            results = TimeSeriesSimulator.simulate_batch(params_list)
+        except Exception:
+            # Fall back to one dataset at a time to find the failing ones
+            for position, params in enumerate(params_list):
+                try:
+                    yield position, TimeSeriesSimulator(params).simulate(), None
+                except Exception as e:
+                    yield position, None, e
+            return
+
+        for position, result in enumerate(results):
+            yield position, result, None
+
+    def _run_parallel(
+        self, params_list: List[TimeSeriesParams]
+    ) -> Iterator[DatasetResult]:
+        """
+        Fans the datasets out to a pool of worker processes.
+
+        Every dataset is simulated into a shared memory buffer created here, the yielded
+        time series are zero-copy views of it. A buffer is released once the consumer
+        asks for the next result, and at most two datasets per worker are in flight,
+        which bounds the shared memory in use.
+        """
+        # One independent child stream per dataset, so the results don't depend
+        # on the number of workers or on the order the datasets finish in
+        seed_sequences = np.random.SeedSequence(self.seed).spawn(len(params_list))
+        pending_positions = iter(range(len(params_list)))
+        futures: Dict[Future, int] = {}
+
+        self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        try:
+            while True:
+                # Keep the pool busy without allocating all the buffers up front
+                for position in pending_positions:
+                    futures[self._submit(position, params_list, seed_sequences)] = (
+                        position
+                    )
+                    if len(futures) >= 2 * self.max_workers:
+                        break
+
+                if not futures:
+                    break
+
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    position = futures.pop(future)
+                    buffer = self._buffers.pop(position)
+                    try:
+                        future.result()
+                        yield position, pd.Series(
+                            buffer.array,
+                            index=params_list[position].time_index,
+                            copy=False,
+                        ), None
+                    except Exception as e:
+                        yield position, None, e
+                    finally:
+                        buffer.release()
+        finally:
+            self.close()
+
+    def _submit(
+        self,
+        position: int,
+        params_list: List[TimeSeriesParams],
+        seed_sequences: List[np.random.SeedSequence],
+    ) -> Future:
+        """Creates the shared buffer of a dataset and submits its simulation."""
+        params = params_list[position]
+        buffer = SharedResultBuffer.create(len(params.time_index))
+        self._buffers[position] = buffer
+
+        return self._executor.submit(
+            simulate_dataset, params, seed_sequences[position], buffer.name
+        )
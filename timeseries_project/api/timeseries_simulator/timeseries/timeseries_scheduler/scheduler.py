@@ -1,6 +1,8 @@
 from multiprocessing import Process
 import psutil
 import os
+import signal
+import sys
 from api.serializers import SimulatorSerializer
 from api.timeseries_simulator.timeseries.timeseries_configurator.configurator_manager import (
     ConfiguratorManager,
@@ -8,10 +10,11 @@ from api.timeseries_simulator.timeseries.timeseries_configurator.configurator_ma
 from api.timeseries_simulator.timeseries.timeseries_producer.producer_creator import (
     ProducerCreator,
 )
-from api.timeseries_simulator.timeseries.timeseries_simulator import (
-    TimeSeriesSimulator,
+from api.timeseries_simulator.timeseries.timeseries_scheduler.dataset_runner import (
+    DatasetRunner,
 )
 import django
+from django.conf import settings
 
 # Set the Django settings module for airflow
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "timeseries_project.settings")
@@ -33,7 +36,7 @@ class Scheduler:
         Starts the execution of the process.
         """
         # Create a process for the simulator.
-        process = Process(target=Scheduler.run_simulator, args=(self.simulator_name,))
+        process = Process(target=Scheduler._run_process, args=(self.simulator_name,))
 
         # Start the process.
         process.start()
@@ -42,6 +45,17 @@ class Scheduler:
         Scheduler.__name_to_pid[self.simulator_name] = process.pid
         print(Scheduler.__name_to_pid)
 
+    @staticmethod
+    def _run_process(simulator_name):
+        """
+        The entry point of the simulator process started by 'start'.
+
+        'stop' terminates the process with SIGTERM, which is turned into a SystemExit
+        so that the run unwinds and releases its workers and shared memory.
+        """
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(1))
+        Scheduler.run_simulator(simulator_name)
+
     @staticmethod
     def run_simulator(simulator_name):
         """
@@ -62,7 +76,7 @@ class Scheduler:
         serializer = SimulatorSerializer(simulator)
 
         # Get the dataset IDs associated with the simulator
-        datasets = simulator.datasets.values()
+        datasets = list(simulator.datasets.values())
 
         # Get the time series parameters
         time_series_param_list = (
@@ -70,21 +84,40 @@ class Scheduler:
             .create_configurator(serializer=serializer)
             .configure()
         )
-        
-        for time_series_params, dataset in zip(time_series_param_list, datasets):
-            time_series_simulator = TimeSeriesSimulator(time_series_params)
-            result_time_series = time_series_simulator.simulate()
-
-            # Send the time series to the sink
-            ProducerCreator("kafka").create(
-                generator_name=dataset["generator_name"],
-                attribute_name=dataset["attribute_name"],
-                topic=simulator.sink_name,
-                host="localhost",
-                port=9092,
-            ).produce(result_time_series)
-
-        simulator.status = "Succeeded"
+
+        # Simulate the datasets, in parallel if more than one worker is configured
+        max_workers = simulator.max_workers or getattr(
+            settings, "TIMESERIES_MAX_WORKERS", 1
+        )
+
+        failed = False
+        # The runner releases its workers and shared memory even if the run is stopped
+        with DatasetRunner(max_workers=max_workers, seed=simulator.seed) as runner:
+            for position, result_time_series, error in runner.run(
+                time_series_param_list
+            ):
+                dataset = datasets[position]
+                if error is not None:
+                    print(
+                        f"Failed to simulate dataset {dataset['generator_name']}: {error}"
+                    )
+                    failed = True
+                    continue
+
+                try:
+                    # Send the time series to the sink
+                    ProducerCreator("kafka").create(
+                        generator_name=dataset["generator_name"],
+                        attribute_name=dataset["attribute_name"],
+                        topic=simulator.sink_name,
+                        host="localhost",
+                        port=9092,
+                    ).produce(result_time_series)
+                except Exception as e:
+                    print(f"Failed to produce dataset {dataset['generator_name']}: {e}")
+                    failed = True
+
+        simulator.status = "Failed" if failed else "Succeeded"
         simulator.save()
 
     def stop(self):
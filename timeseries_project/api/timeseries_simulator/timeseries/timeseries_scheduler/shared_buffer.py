@@ -0,0 +1,89 @@
+from multiprocessing import resource_tracker, shared_memory
+import numpy as np
+
+
+class SharedResultBuffer:
+    """
+    A float64 array living in a shared memory block.
+
+    The parent process creates the block and owns its lifetime, the worker process
+    attaches to it by name and writes the simulated values in place, so the result
+    travels back to the parent without being pickled or copied.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, length: int):
+        """
+        Initializes a SharedResultBuffer instance, use 'create' or 'attach' instead.
+
+        Args:
+            shm (shared_memory.SharedMemory): The shared memory block.
+            length (int): The number of float64 values in the block.
+        """
+        self.shm = shm
+        self.length = length
+        self.array = np.ndarray((length,), dtype=np.float64, buffer=shm.buf)
+
+    @property
+    def name(self) -> str:
+        """The name of the shared memory block, used by the workers to attach to it."""
+        return self.shm.name
+
+    @classmethod
+    def create(cls, length: int) -> "SharedResultBuffer":
+        """
+        Creates a new shared memory block holding 'length' float64 values.
+
+        Args:
+            length (int): The number of values of the buffer.
+
+        Returns:
+            SharedResultBuffer: The buffer, it must be released by the creator.
+        """
+        # Shared memory blocks can't be empty
+        size = max(1, length * np.dtype(np.float64).itemsize)
+        return cls(shared_memory.SharedMemory(create=True, size=size), length)
+
+    @classmethod
+    def attach(cls, name: str, length: int) -> "SharedResultBuffer":
+        """
+        Attaches to a shared memory block created by another process.
+
+        The block is not tracked by this process, so it is neither unlinked nor
+        reported as leaked when the worker exits, its creator owns it.
+
+        Args:
+            name (str): The name of the shared memory block.
+            length (int): The number of values of the buffer.
+
+        Returns:
+            SharedResultBuffer: The buffer, it must be closed by the caller.
+        """
+        try:
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # Before Python 3.13 attaching always registers the block
+            shm = shared_memory.SharedMemory(name=name)
+            resource_tracker.unregister(shm._name, "shared_memory")
+
+        return cls(shm, length)
+
+    def close(self):
+        """
+        Unmaps the block from this process.
+
+        If arrays built on top of the buffer are still alive, the mapping is kept
+        until they are garbage collected, so they never point to unmapped memory.
+        """
+        self.array = None
+        try:
+            self.shm.close()
+        except BufferError:
+            pass
+
+    def release(self):
+        """Closes and destroys the block, it must only be called by its creator."""
+        self.close()
+        try:
+            self.shm.unlink()
+        except FileNotFoundError:
+            pass
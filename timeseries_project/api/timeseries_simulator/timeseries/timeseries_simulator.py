@@ -1,9 +1,8 @@
 import pandas as pd
-from typing import List
+import numpy as np
+from typing import Dict, Hashable, Iterator, List, Tuple
 from .timeseries_components.transformers.transformer import Transformer
 from .timeseries_components.generators.generator import Generator
-from operator import mul, add
-from functools import reduce
 from dataclasses import dataclass
 
 
@@ -28,22 +27,184 @@ class TimeSeriesSimulator:
 
     def simulate(self) -> pd.Series:
         """Generates a time series based on the main and residual components."""
+        return self._simulate_window(self.time_index, offset=0)
+
+    def simulate_iter(self, chunk_size: int) -> Iterator[pd.Series]:
+        """
+        Generates the time series as a sequence of contiguous windows.
+
+        Only one window is materialized at a time, so the peak memory is O(chunk_size)
+        instead of O(len(time_index)). The main components are generated with the
+        global offset of each window, so the joined windows match a one-shot run.
+        The residual components are applied window by window, they keep their ratios
+        but transformers that need the whole series (e.g. normalization) see one
+        window at a time.
+
+        Args:
+            chunk_size (int): The maximum number of points of each window.
+
+        Yields:
+            pd.Series: The next window of the time series, indexed by its timestamps.
+        """
+        if chunk_size <= 0:
+            raise ValueError("The chunk size must be a positive integer.")
+
+        for offset in range(0, len(self.time_index), chunk_size):
+            yield self._simulate_window(
+                self.time_index[offset : offset + chunk_size], offset=offset
+            )
+
+    def _simulate_window(self, time_index: pd.DatetimeIndex, offset: int) -> pd.Series:
+        """Generates the window of the time series starting at the given offset."""
+        values = self.simulate_into(np.empty(len(time_index)), time_index, offset)
+
+        # The Series wraps the buffer without copying it
+        return pd.Series(values, index=time_index, copy=False)
+
+    def simulate_into(
+        self, out: np.ndarray, time_index: pd.DatetimeIndex = None, offset: int = 0
+    ) -> np.ndarray:
+        """
+        Generates the time series values directly into a preallocated float buffer.
+
+        The main components are generated with Generator.generate_into and folded in
+        place, and the residual components are applied with Transformer.transform_inplace,
+        so a run only owns 'out' and one scratch buffer of the same size.
+
+        Args:
+            out (np.ndarray): A float64 buffer of len(time_index) points to write into.
+            time_index (pd.DatetimeIndex): The time points to generate, defaults to the
+                whole time index of the simulator.
+            offset (int): The position of the first point of 'time_index' in the whole series.
+
+        Returns:
+            np.ndarray: The 'out' buffer holding the time series values.
+        """
+        if time_index is None:
+            time_index = self.time_index
+
         # Choosing the operation to be performed based on the time series type
-        operation = mul if self.multiplicative else add
+        operation = np.multiply if self.multiplicative else np.add
+
+        if not self.main_components:
+            raise ValueError("A time series needs at least one main component.")
 
         # Applying the main components
-        result_series = pd.Series(
-            reduce(
-                lambda x, y: operation(x, y),
-                [mc.generate(self.time_index) for mc in self.main_components],
-            )
-        )
+        first_component, *other_components = self.main_components
+        first_component.generate_into(out, time_index, offset)
+        if other_components:
+            scratch = np.empty_like(out)
+            for mc in other_components:
+                operation(out, mc.generate_into(scratch, time_index, offset), out=out)
 
         # Applying the residual components
         for rc in self.residual_components:
-            result_series = rc.transform(result_series)
+            rc.transform_inplace(out)
+
+        return out
+
+    @staticmethod
+    def simulate_batch(params_list: List[TimeSeriesParams]) -> List[pd.Series]:
+        """
+        Generates many time series at once, grouping the ones that share a time index.
+
+        The datasets of each group are stacked into one (n_datasets, n_points) matrix,
+        then every component class is evaluated for all the rows of the group in a
+        single vectorized call (see Generator.generate_batch and Transformer.transform_batch).
+
+        Args:
+            params_list (List[TimeSeriesParams]): The parameters of the time series to simulate.
+
+        Returns:
+            List[pd.Series]: The simulated time series, in the same order as params_list.
+        """
+        results: List[pd.Series] = [None] * len(params_list)
+
+        for positions in TimeSeriesSimulator._group_by_index(params_list).values():
+            group = [params_list[position] for position in positions]
+            time_index = group[0].time_index
+
+            matrix = TimeSeriesSimulator._simulate_matrix(group, time_index)
+
+            for row, position in enumerate(positions):
+                results[position] = pd.Series(matrix[row], index=time_index)
+
+        return results
+
+    @staticmethod
+    def _group_by_index(
+        params_list: List[TimeSeriesParams],
+    ) -> Dict[Hashable, List[int]]:
+        """Groups the positions of the params by time index and time series type."""
+        groups: Dict[Hashable, List[int]] = {}
+        for position, params in enumerate(params_list):
+            time_index = params.time_index
+            if len(time_index) and time_index.freq is not None:
+                index_key = (len(time_index), time_index[0], time_index.freqstr)
+            else:
+                # Irregular or empty indexes are only grouped with themselves
+                index_key = id(time_index)
+
+            groups.setdefault((index_key, params.multiplicative), []).append(position)
+
+        return groups
+
+    @staticmethod
+    def _simulate_matrix(
+        group: List[TimeSeriesParams], time_index: pd.DatetimeIndex
+    ) -> np.ndarray:
+        """Simulates a group of time series sharing the same time index and type."""
+        if not all(params.main_components for params in group):
+            raise ValueError("A time series needs at least one main component.")
+
+        multiplicative = group[0].multiplicative
+        operation = np.multiply if multiplicative else np.add
+        matrix = np.full((len(group), len(time_index)), 1.0 if multiplicative else 0.0)
+
+        # The main components are commutative, so they are applied by class,
+        # each pass takes at most one component of that class from every row
+        for rows, generators in TimeSeriesSimulator._passes(
+            [params.main_components for params in group], keep_order=False
+        ):
+            components = type(generators[0]).generate_batch(generators, time_index)
+            matrix[rows] = operation(matrix[rows], components)
+
+        # The residual components are applied position by position to keep their order
+        for rows, transformers in TimeSeriesSimulator._passes(
+            [params.residual_components for params in group], keep_order=True
+        ):
+            matrix[rows] = type(transformers[0]).transform_batch(
+                transformers, matrix[rows]
+            )
+
+        return matrix
+
+    @staticmethod
+    def _passes(
+        components_per_row: List[list], keep_order: bool
+    ) -> List[Tuple[List[int], list]]:
+        """
+        Splits the components of every row into passes of the same class.
+
+        Each pass holds at most one component per row, so it can be evaluated with one
+        batch call. If keep_order is True, the i-th component of a row is always
+        applied in an earlier pass than its (i + 1)-th component.
+        """
+        passes: Dict[Hashable, Tuple[List[int], list]] = {}
+        occurrences: Dict[Tuple[int, type], int] = {}
+        for row, components in enumerate(components_per_row):
+            for position, component in enumerate(components):
+                component_class = type(component)
+                if keep_order:
+                    key = (position, component_class)
+                else:
+                    occurrence = occurrences.get((row, component_class), 0)
+                    occurrences[(row, component_class)] = occurrence + 1
+                    key = (occurrence, component_class)
+
+                rows, components_of_pass = passes.setdefault(key, ([], []))
+                rows.append(row)
+                components_of_pass.append(component)
 
-        # Add the timestamp index
-        result_series.index = self.time_index
-        
-        return result_series
+        # Sorting is stable, so passes of the same position keep their insertion order
+        return [passes[key] for key in sorted(passes, key=lambda key: key[0])]
@@ -125,3 +125,9 @@ STATIC_URL = "/static/"
 # https://docs.djangoproject.com/en/3.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+
+# Time series simulator
+# The number of processes simulating the datasets of a simulator in parallel,
+# a simulator can override it with its max_workers field
+TIMESERIES_MAX_WORKERS = 1